@@ -2,18 +2,319 @@
 RSS 2.0 implementations based on [this RSS 2.0 documentation](https://validator.w3.org/feed/docs/rss2.html).
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Iterable, List, Optional, Set, TextIO, Tuple, TypeVar, Union
+from weakref import ref
 
 from markyp import IElement, PropertyDict
-from markyp.formatters import format_properties, xml_escape
+from markyp.formatters import format_properties
 
 
 __all__ = ("Category", "Cloud", "Enclosure", "GUID", "Image", "Source", "Item", "Channel", "RSS")
 
 
-class Category(IElement):
+_T = TypeVar("_T")
+
+
+def _as_list(values: Union[List[_T], Tuple[_T, ...], None]) -> List[_T]:
+    """
+    Returns the given list itself, or a new list with the given tuple's items (if any).
+
+    Containers store the arguments of their `set_*()` methods as tuples and only convert
+    them to a list when something is added to them.
+
+    Arguments:
+        values: The list or tuple to convert.
+    """
+    if values is None:
+        return []
+    return values if isinstance(values, list) else list(values)
+
+
+def _xml_escape(value: str) -> str:
+    """
+    Escapes `&`, `<` and `>` in the given string, just like `xml.sax.saxutils.escape()`.
+
+    Chained `str.replace()` calls are used because they are much faster than `str.translate()`
+    with a multi-character mapping, and they return the original string if there is nothing
+    to replace.
+
+    Arguments:
+        value: The string to escape.
+    """
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+_cached_xml_escape: Callable[[str], str] = lru_cache(maxsize=1024)(_xml_escape)
+"""
+Memoized version of `_xml_escape()` for short values that are likely to be repeated
+many times in a feed, like category names.
+"""
+
+
+class _CachedElement(IElement):
+    """
+    Base class for elements that cache their rendered markup.
+
+    Assigning a public attribute of the element drops its cached markup, together with the
+    cached markup of every container that rendered the element.
+    """
+
+    __slots__ = ("_cached", "_parents", "_rendered", "_version", "__weakref__")
+
+    _cached: Optional[str]
+    """The cached markup of the element, `None` if the element must be rendered again."""
+
+    _parents: Optional[Set["ref[_CachedContainer]"]]
+    """
+    Weak references to the containers that rendered the element since it last changed.
+    Elements can be shared by multiple parents, so containers register themselves when they
+    render the element, and they are notified and forgotten when the element changes.
+    """
+
+    _rendered: bool
+    """
+    Whether the element has been rendered since it last changed. Changes of elements that
+    have not been rendered yet can not make any markup stale, so they are not tracked.
+    """
+
+    _version: int
+    """
+    The number of tracked changes of the element. Rendered markup is only cached if it did
+    not change during rendering.
+    """
+
+    def __init__(self, _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> None:
+        """
+        Initialization.
+        """
+        _setattr(self, "_cached", None)
+        _setattr(self, "_parents", None)
+        _setattr(self, "_rendered", False)
+        _setattr(self, "_version", 0)
+
+    def __setattr__(self,
+                    name: str,
+                    value: Any,
+                    _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> None:
+        _setattr(self, name, value)
+        if name[0] != "_" and self._rendered:
+            self._invalidate()
+
+    def __str__(self, _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> str:
+        cached: Optional[str] = self._cached
+        if cached is None:
+            _setattr(self, "_rendered", True)
+            version: int = self._version
+            cached = self._render()
+            if version == self._version:
+                _setattr(self, "_cached", cached)
+        return cached
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__ for name in cls.__dict__.get("__slots__", ())
+            if name != "__weakref__" and hasattr(self, name)
+        }
+        # Weak references can not be copied, the containers of the copy register themselves
+        # when they render it.
+        state["_parents"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Bypass __setattr__(), it needs the private slots that may not be restored yet.
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def dump(self, fp: TextIO) -> None:
+        """
+        Writes the markup of the element to the given text stream.
+
+        The markup fragments of the element are written as soon as they are rendered, so the
+        markup of large containers is never built as a single string.
+
+        Arguments:
+            fp: The text stream to write the markup to.
+        """
+        self._emit(fp.write)
+
+    def write(self, buf: List[str]) -> None:
+        """
+        Appends the markup of the element to the given buffer.
+
+        The markup may be split into several fragments, `"".join(buf)` produces the string
+        representation of the element.
+
+        Arguments:
+            buf: The list to append the markup fragments to.
+        """
+        self._emit(buf.append)
+
+    def _emit(self, append: Callable[[str], Any], parent: Optional["ref[_CachedContainer]"] = None) -> None:
+        """
+        Passes the markup of the element, possibly split into several fragments, to `append`.
+
+        Arguments:
+            append: The callable that receives the markup fragments one by one,
+                    for example `list.append` or the `write()` method of a text stream.
+            parent: Weak reference to the container that is being rendered, if any.
+        """
+        append(str(self) if parent is None else self._markup(parent))
+
+    def _markup(self,
+                parent: "ref[_CachedContainer]",
+                _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> str:
+        """
+        Returns the markup of the element and registers the given container as one that must
+        be invalidated when the element changes.
+
+        The container is registered before the markup is read, so changes made while the
+        container is being rendered are not missed.
+
+        Arguments:
+            parent: Weak reference to the container that is being rendered.
+        """
+        parents = self._parents
+        if parents is None:
+            _setattr(self, "_parents", {parent})
+        else:
+            parents.add(parent)
+
+        cached: Optional[str] = self._cached
+        return str(self) if cached is None else cached
+
+    def _invalidate(self, _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> None:
+        """
+        Drops the cached markup of the element and of all the containers that rendered it.
+
+        Nothing happens if the element has not been rendered since it last changed.
+        """
+        if not self._rendered:
+            return
+
+        _setattr(self, "_rendered", False)
+        _setattr(self, "_cached", None)
+        _setattr(self, "_version", self._version + 1)
+
+        parents = self._parents
+        if parents is not None:
+            _setattr(self, "_parents", None)
+            for parent_ref in parents:
+                parent = parent_ref()
+                if parent is not None:
+                    parent._invalidate()
+
+    def _render(self) -> str:
+        """
+        Returns the string representation of the element, ignoring the cache.
+        """
+        raise NotImplementedError(
+            "_CachedElement is abstract, please override _render() in the child class."
+        )
+
+
+class _CachedContainer(_CachedElement):
+    """
+    Base class for cached elements that have child elements.
+    """
+
+    __slots__ = ("_fields",)
+
+    _fields: Any
+    """
+    The rendered markup of the attributes of the element that are not elements themselves,
+    `None` if they must be rendered again. It only depends on the element itself, so unlike
+    the cached markup, it remains valid when a child element changes. Subclasses define its
+    exact type.
+    """
+
+    _field_names: ClassVar[FrozenSet[str]] = frozenset()
+    """The names of the attributes that are rendered into `_fields`."""
+
+    def __init__(self, _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> None:
+        """
+        Initialization.
+        """
+        super().__init__()
+        _setattr(self, "_fields", None)
+
+    def __setattr__(self,
+                    name: str,
+                    value: Any,
+                    _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> None:
+        _setattr(self, name, value)
+        if name[0] != "_":
+            if name in self._field_names and self._fields is not None:
+                _setattr(self, "_fields", None)
+            if self._rendered:
+                self._invalidate()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        # The children of the copy do not know about it, so its markup is rendered again.
+        state["_cached"] = None
+        state["_rendered"] = False
+        return state
+
+    def _emit(self,
+              append: Callable[[str], Any],
+              parent: Optional["ref[_CachedContainer]"] = None,
+              _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> None:
+        if parent is not None:
+            parents = self._parents
+            if parents is None:
+                _setattr(self, "_parents", {parent})
+            else:
+                parents.add(parent)
+
+        cached: Optional[str] = self._cached
+        if cached is None:
+            _setattr(self, "_rendered", True)
+            self._write(append)
+        else:
+            append(cached)
+
+    def _write(self, append: Callable[[str], Any]) -> None:
+        """
+        Passes the markup of the element to `append` when the element has no cached markup.
+
+        Containers that can be large should override this method to emit their children
+        one by one instead of rendering (and caching) a single string.
+
+        Arguments:
+            append: The callable that receives the markup fragments one by one.
+        """
+        append(str(self))
+
+    def _get_fields(self, _setattr: Callable[[Any, str, Any], None] = object.__setattr__) -> Any:
+        """
+        Returns the cached markup of the attributes of the element that are not elements,
+        rendering it with `_render_fields()` if necessary.
+        """
+        fields = self._fields
+        if fields is None:
+            version: int = self._version
+            fields = self._render_fields()
+            if version == self._version:
+                _setattr(self, "_fields", fields)
+        return fields
+
+    def _render_fields(self) -> Any:
+        """
+        Renders the attributes of the element that are not elements themselves.
+        """
+        raise NotImplementedError(
+            "_CachedContainer has no fields, please override _render_fields() in the child class."
+        )
+
+
+class Category(_CachedElement):
     """
     The category definition of an item.
+
+    The markup of the category is rendered once and reused until the category is modified,
+    so the same instance can be shared by all the items and channels that belong to it.
     """
 
     __slots__ = ("value", "domain")
@@ -27,18 +328,20 @@ class Category(IElement):
                    hierarchic location in the indicated taxonomy.
             domain: A string that identifies a categorization taxonomy.
         """
+        super().__init__()
+
         self.value: str = value
         """Forward-slash-separated string that identifies a hierarchic location in the indicated taxonomy."""
 
         self.domain: Optional[str] = domain
         """A string that identifies a categorization taxonomy."""
 
-    def __str__(self) -> str:
+    def _render(self, _esc: Callable[[str], str] = _cached_xml_escape) -> str:
         domain = f" domain=\"{self.domain}\"" if self.domain else ""
-        return f"<category{domain}>{xml_escape(self.value)}</category>"
+        return f"<category{domain}>{_esc(self.value)}</category>"
 
 
-class Cloud(IElement):
+class Cloud(_CachedElement):
     """
     `Channel` subelement that specifies a web service that supports the `rssCloud` interface.
 
@@ -52,13 +355,15 @@ class Cloud(IElement):
         """
         Initialization.
         """
+        super().__init__()
+
         self.domain: str = domain
         self.port: int = port
         self.path: str = path
         self.register_procedure: str = register_procedure
         self.protocol: str = protocol
 
-    def __str__(self) -> str:
+    def _render(self, _format_properties: Callable[[PropertyDict], str] = format_properties) -> str:
         properties: PropertyDict = {
             "domain": self.domain,
             "port": self.port,
@@ -66,10 +371,10 @@ class Cloud(IElement):
             "registerProcedure": self.register_procedure,
             "protocol": self.protocol
         }
-        return f"<cloud {format_properties(properties)}/>"
+        return f"<cloud {_format_properties(properties)}/>"
 
 
-class Enclosure(IElement):
+class Enclosure(_CachedElement):
     """
     Describes a media object that is attached to an item.
     """
@@ -85,6 +390,8 @@ class Enclosure(IElement):
             length: The length of the enclosure in bytes.
             type_: The MIME type of the enclosure.
         """
+        super().__init__()
+
         self.url: str = url
         """The URL where the enclosure is located."""
 
@@ -94,16 +401,16 @@ class Enclosure(IElement):
         self.type: str = type_
         """The MIME type of the enclosure."""
 
-    def __str__(self) -> str:
+    def _render(self, _format_properties: Callable[[PropertyDict], str] = format_properties) -> str:
         properties: PropertyDict = {
             "url": self.url,
             "length": self.length,
             "type": self.type
         }
-        return f"<enclosure {format_properties(properties)}/>"
+        return f"<enclosure {_format_properties(properties)}/>"
 
 
-class GUID(IElement):
+class GUID(_CachedElement):
     """
     Globally unique identifier of an item.
     """
@@ -118,18 +425,20 @@ class GUID(IElement):
             value: The string that uniquely identifies an item.
             is_perma_link: Whether the GUID is a permanent link to the item.
         """
+        super().__init__()
+
         self.value: str = value
         """The string that uniquely identifies an item."""
 
         self.is_perma_link: bool = is_perma_link
         """Whether the GUID is a permanent link to the item."""
 
-    def __str__(self) -> str:
+    def _render(self, _esc: Callable[[str], str] = _xml_escape) -> str:
         is_perma_link: str = "true" if self.is_perma_link else "false"
-        return f"<guid isPermaLink=\"{is_perma_link}\">{xml_escape(self.value)}</guid>"
+        return f"<guid isPermaLink=\"{is_perma_link}\">{_esc(self.value)}</guid>"
 
 
-class Image(IElement):
+class Image(_CachedElement):
     """
     `Channel` subelement that specifies a GIF, JPEG or PNG image that can be displayed with the channel.
     """
@@ -140,6 +449,8 @@ class Image(IElement):
         """
         Initialization.
         """
+        super().__init__()
+
         self.url: Optional[str] = url
         """The URL of a GIF, JPEG or PNG image that represents the channel. """
 
@@ -149,19 +460,14 @@ class Image(IElement):
         self.link: Optional[str] = link
         """The URL of the site, when the channel is rendered, the image is a link to the site."""
 
-    def __str__(self) -> str:
-        items = ["<image>"]
-        if self.title is not None:
-            items.append(f"<title>{xml_escape(self.title)}</title>")
-        if self.url is not None:
-            items.append(f"<url>{xml_escape(self.url)}</url>")
-        if self.link is not None:
-            items.append(f"<link>{xml_escape(self.link)}</link>")
-        items.append("</image>")
-        return "\n".join(items)
+    def _render(self, _esc: Callable[[str], str] = _xml_escape) -> str:
+        title = f"<title>{_esc(self.title)}</title>\n" if self.title is not None else ""
+        url = f"<url>{_esc(self.url)}</url>\n" if self.url is not None else ""
+        link = f"<link>{_esc(self.link)}</link>\n" if self.link is not None else ""
+        return f"<image>\n{title}{url}{link}</image>"
 
 
-class Source(IElement):
+class Source(_CachedElement):
     """
     The RSS channel an item originates from.
     """
@@ -176,18 +482,20 @@ class Source(IElement):
             url: The link to the XMLization of the source
             value: The name of the RSS channel an item originates from.
         """
+        super().__init__()
+
         self.url: str = url
         """The link to the XMLization of the source"""
 
         self.value: str = value
         """The name of the RSS channel an item originates from."""
 
-    def __str__(self) -> str:
-        value: str = xml_escape(self.value) if self.value is not None else ""
-        return f"<source url=\"{self.url}\">{xml_escape(value)}</source>"
+    def _render(self, _esc: Callable[[str], str] = _xml_escape) -> str:
+        value: str = _esc(self.value) if self.value is not None else ""
+        return f"<source url=\"{self.url}\">{value}</source>"
 
 
-class Item(IElement):
+class Item(_CachedContainer):
     """
     `Channel` subelement representing a single feed item.
     """
@@ -197,6 +505,13 @@ class Item(IElement):
         "comments", "enclosure", "guid", "pub_date", "source"
     )
 
+    _fields: Optional[Tuple[str, str]]
+    """The rendered markup of the item from the opening tag until the enclosure, and its publication date."""
+
+    _field_names: ClassVar[FrozenSet[str]] = frozenset((
+        "title", "link", "description", "author", "comments", "pub_date"
+    ))
+
     def __init__(self,
                  title: str,
                  link: str,
@@ -224,6 +539,8 @@ class Item(IElement):
             pub_date: The publication date of the item.
             source: The RSS channel the item originates from.
         """
+        super().__init__()
+
         self.title: str = title
         """The title of the item."""
 
@@ -236,8 +553,9 @@ class Item(IElement):
         self.author: Optional[str] = author
         """The email address of the author of the item."""
 
-        self._categories: List[Category] = categories or []
-        """The list of categories the item belongs to."""
+        self._categories: Union[List[Category], Tuple[Category, ...], None] =\
+            tuple(categories) if categories else None
+        """The list of categories the item belongs to, `None` until the first category is added."""
 
         self.comments: Optional[str] = comments
         """URL of a page for comments relating to the item."""
@@ -254,32 +572,37 @@ class Item(IElement):
         self.source: Optional[Source] = source
         """The RSS channel the item originates from."""
 
-    def __str__(self) -> str:
-        items = [
-            "<item>",
-            f"<title>{xml_escape(self.title)}</title>",
-            f"<link>{xml_escape(self.link)}</link>"
-        ]
-
-        if self.description is not None:
-            items.append(f"<description>{xml_escape(self.description)}</description>")
-        if self.author is not None:
-            items.append(f"<author>{xml_escape(self.author)}</author>")
-        if self.comments is not None:
-            items.append(f"<comments>{xml_escape(self.comments)}</comments>")
-        if self.enclosure is not None:
-            items.append(str(self.enclosure))
-        if self.guid is not None:
-            items.append(str(self.guid))
-        if self.pub_date is not None:
-            items.append(f"<pubDate>{xml_escape(self.pub_date)}</pubDate>")
-        if self.source is not None:
-            items.append(str(self.source))
-
-        items.extend((str(cat) for cat in self._categories))
-
-        items.append("</item>")
-        return "\n".join(items)
+    def _render(self) -> str:
+        fields: Tuple[str, str] = self._get_fields()
+        head, pub_date = fields
+
+        parent = ref(self)
+        enclosure = f"{self.enclosure._markup(parent)}\n" if self.enclosure is not None else ""
+        guid = f"{self.guid._markup(parent)}\n" if self.guid is not None else ""
+        source = f"{self.source._markup(parent)}\n" if self.source is not None else ""
+        categories = "\n".join([category._markup(parent) for category in self._categories]) + "\n"\
+            if self._categories else ""
+
+        return f"{head}{enclosure}{guid}{pub_date}{source}{categories}</item>"
+
+    def _render_fields(self, _esc: Callable[[str], str] = _xml_escape) -> Tuple[str, str]:
+        """
+        Renders the string attributes of the item.
+
+        Returns:
+            The markup from the opening tag until the enclosure and the markup of the publication date.
+        """
+        description = f"<description>{_esc(self.description)}</description>\n"\
+            if self.description is not None else ""
+        author = f"<author>{_esc(self.author)}</author>\n" if self.author is not None else ""
+        comments = f"<comments>{_esc(self.comments)}</comments>\n" if self.comments is not None else ""
+        pub_date = f"<pubDate>{_esc(self.pub_date)}</pubDate>\n" if self.pub_date is not None else ""
+
+        return (
+            f"<item>\n<title>{_esc(self.title)}</title>\n<link>{_esc(self.link)}</link>\n"
+            f"{description}{author}{comments}",
+            pub_date
+        )
 
     def add_category(self, category: Category) -> "Item":
         """
@@ -292,7 +615,11 @@ class Item(IElement):
         Returns:
             The item itself, allowing method chaining.
         """
-        self._categories.append(category)
+        current = _as_list(self._categories)
+        current.append(category)
+        self._categories = current
+        if self._rendered:
+            self._invalidate()
         return self
 
     def add_categories(self, *categories: Category) -> "Item":
@@ -303,7 +630,26 @@ class Item(IElement):
         Returns:
             The item itself, allowing method chaining.
         """
-        self._categories.extend(categories)
+        return self.add_categories_from(categories)
+
+    def add_categories_from(self, categories: Iterable[Category]) -> "Item":
+        """
+        Adds the `Category` instances of the given iterable to the item.
+
+        Prefer this method to `add_categories()` if the categories are already
+        in a list or are produced by a generator.
+
+        Arguments:
+            categories: The `Category` instances to add to the item.
+
+        Returns:
+            The item itself, allowing method chaining.
+        """
+        current = _as_list(self._categories)
+        current.extend(categories)
+        self._categories = current
+        if self._rendered:
+            self._invalidate()
         return self
 
     def set_categories(self, *categories: Category) -> "Item":
@@ -314,12 +660,29 @@ class Item(IElement):
         Returns:
             The item itself, allowing method chaining.
         """
-        self._categories.clear()
-        self._categories.extend(categories)
+        return self.set_categories_from(categories)
+
+    def set_categories_from(self, categories: Iterable[Category]) -> "Item":
+        """
+        Replaces the current categories of the item with the `Category`
+        instances of the given iterable.
+
+        Prefer this method to `set_categories()` if the categories are already
+        in a list or are produced by a generator.
+
+        Arguments:
+            categories: The new categories of the item.
+
+        Returns:
+            The item itself, allowing method chaining.
+        """
+        self._categories = tuple(categories)
+        if self._rendered:
+            self._invalidate()
         return self
 
 
-class Channel(IElement):
+class Channel(_CachedContainer):
     """
     The `<channel></channel>` element.
     """
@@ -330,6 +693,14 @@ class Channel(IElement):
         "generator", "docs", "cloud", "ttl", "image", "_categories", "_items"
     )
 
+    _fields: Optional[str]
+    """The rendered markup of the channel from the opening tag until the cloud."""
+
+    _field_names: ClassVar[FrozenSet[str]] = frozenset((
+        "title", "link", "description", "language", "copyright", "managing_editor",
+        "web_master", "pub_date", "last_build_date", "generator", "docs", "ttl"
+    ))
+
     def __init__(self,
                  title:str,
                  link: str,
@@ -371,6 +742,8 @@ class Channel(IElement):
             categories: The list of categories that the channel belongs to.
             items: The items in the channel.
         """
+        super().__init__()
+
         # Mandatory properties.
         self.title: str = title
         """The name of the channel - mandatory property."""
@@ -420,48 +793,68 @@ class Channel(IElement):
         # The textInput subelement is not implemented, because it's not really in use.
 
         # Protected properties.
-        self._categories: List[Category] = categories or []
-        """The list of categories that the channel belongs to."""
-
-        self._items: List[Item] = items or []
-        """The items in the channel."""
-
-    def __str__(self) -> str:
-        items = [
-            "<channel>",
-            f"<title>{xml_escape(self.title)}</title>",
-            f"<link>{xml_escape(self.link)}</link>",
-            f"<description>{xml_escape(self.description)}</description>"
-        ]
-
-        if self.language is not None:
-            items.append(f"<language>{xml_escape(self.language)}</language>")
-        if self.copyright is not None:
-            items.append(f"<copyright>{xml_escape(self.copyright)}</copyright>")
-        if self.managing_editor is not None:
-            items.append(f"<managingEditor>{xml_escape(self.managing_editor)}</managingEditor>")
-        if self.web_master is not None:
-            items.append(f"<webMaster>{xml_escape(self.web_master)}</webMaster>")
-        if self.pub_date is not None:
-            items.append(f"<pubDate>{xml_escape(self.pub_date)}</pubDate>")
-        if self.last_build_date is not None:
-            items.append(f"<lastBuildDate>{xml_escape(self.last_build_date)}</lastBuildDate>")
-        if self.generator is not None:
-            items.append(f"<generator>{xml_escape(self.generator)}</generator>")
-        if self.docs is not None:
-            items.append(f"<docs>{xml_escape(self.docs)}</docs>")
-        if self.ttl is not None:
-            items.append(f"<ttl>{str(self.ttl)}</ttl>")
+        self._categories: Union[List[Category], Tuple[Category, ...], None] =\
+            tuple(categories) if categories else None
+        """The list of categories that the channel belongs to, `None` until the first category is added."""
+
+        self._items: Union[List[Item], Tuple[Item, ...], None] =\
+            tuple(items) if items else None
+        """The items in the channel, `None` until the first item is added."""
+
+    def _render(self) -> str:
+        buf: List[str] = []
+        self._write(buf.append)
+        return "".join(buf)
+
+    def _write(self, append: Callable[[str], Any]) -> None:
+        fields: str = self._get_fields()
+        append(fields)
+
+        parent = ref(self)
         if self.cloud is not None:
-            items.append(str(self.cloud))
+            self.cloud._emit(append, parent)
+            append("\n")
         if self.image is not None:
-            items.append(str(self.image))
-
-        items.extend(str(cat) for cat in self._categories)
-        items.extend((str(item) for item in self._items))
+            self.image._emit(append, parent)
+            append("\n")
+        if self._categories:
+            for category in self._categories:
+                category._emit(append, parent)
+                append("\n")
+        if self._items:
+            for item in self._items:
+                item._emit(append, parent)
+                append("\n")
+        append("</channel>")
+
+    def _render_fields(self, _esc: Callable[[str], str] = _xml_escape) -> str:
+        """
+        Renders the string attributes of the channel.
 
-        items.append("</channel>")
-        return "\n".join(items)
+        Returns:
+            The markup from the opening tag until the cloud.
+        """
+        language = f"<language>{_esc(self.language)}</language>\n" if self.language is not None else ""
+        copyright_ = f"<copyright>{_esc(self.copyright)}</copyright>\n"\
+            if self.copyright is not None else ""
+        managing_editor = f"<managingEditor>{_esc(self.managing_editor)}</managingEditor>\n"\
+            if self.managing_editor is not None else ""
+        web_master = f"<webMaster>{_esc(self.web_master)}</webMaster>\n"\
+            if self.web_master is not None else ""
+        pub_date = f"<pubDate>{_esc(self.pub_date)}</pubDate>\n" if self.pub_date is not None else ""
+        last_build_date = f"<lastBuildDate>{_esc(self.last_build_date)}</lastBuildDate>\n"\
+            if self.last_build_date is not None else ""
+        generator = f"<generator>{_esc(self.generator)}</generator>\n"\
+            if self.generator is not None else ""
+        docs = f"<docs>{_esc(self.docs)}</docs>\n" if self.docs is not None else ""
+        ttl = f"<ttl>{self.ttl}</ttl>\n" if self.ttl is not None else ""
+
+        return (
+            f"<channel>\n<title>{_esc(self.title)}</title>\n<link>{_esc(self.link)}</link>\n"
+            f"<description>{_esc(self.description)}</description>\n"
+            f"{language}{copyright_}{managing_editor}{web_master}{pub_date}{last_build_date}"
+            f"{generator}{docs}{ttl}"
+        )
 
     def add_category(self, category: Category) -> "Channel":
         """
@@ -474,7 +867,11 @@ class Channel(IElement):
         Returns:
             The channel itself, allowing method chaining.
         """
-        self._categories.append(category)
+        current = _as_list(self._categories)
+        current.append(category)
+        self._categories = current
+        if self._rendered:
+            self._invalidate()
         return self
 
     def add_categories(self, *categories: Category) -> "Channel":
@@ -485,7 +882,26 @@ class Channel(IElement):
         Returns:
             The channel itself, allowing method chaining.
         """
-        self._categories.extend(categories)
+        return self.add_categories_from(categories)
+
+    def add_categories_from(self, categories: Iterable[Category]) -> "Channel":
+        """
+        Adds the `Category` instances of the given iterable to the channel.
+
+        Prefer this method to `add_categories()` if the categories are already
+        in a list or are produced by a generator.
+
+        Arguments:
+            categories: The `Category` instances to add to the channel.
+
+        Returns:
+            The channel itself, allowing method chaining.
+        """
+        current = _as_list(self._categories)
+        current.extend(categories)
+        self._categories = current
+        if self._rendered:
+            self._invalidate()
         return self
 
     def add_item(self, item: Item) -> "Channel":
@@ -499,7 +915,11 @@ class Channel(IElement):
         Returns:
             The channel itself, allowing method chaining.
         """
-        self._items.append(item)
+        current = _as_list(self._items)
+        current.append(item)
+        self._items = current
+        if self._rendered:
+            self._invalidate()
         return self
 
     def add_items(self, *items: Item) -> "Channel":
@@ -510,7 +930,26 @@ class Channel(IElement):
         Returns:
             The channel itself, allowing method chaining.
         """
-        self._items.extend(items)
+        return self.add_items_from(items)
+
+    def add_items_from(self, items: Iterable[Item]) -> "Channel":
+        """
+        Adds the `Item` instances of the given iterable to the channel.
+
+        Prefer this method to `add_items()` if the items are already in a list
+        or are produced by a generator.
+
+        Arguments:
+            items: The `Item` instances to add to the channel.
+
+        Returns:
+            The channel itself, allowing method chaining.
+        """
+        current = _as_list(self._items)
+        current.extend(items)
+        self._items = current
+        if self._rendered:
+            self._invalidate()
         return self
 
     def set_categories(self, *categories: Category) -> "Channel":
@@ -521,8 +960,25 @@ class Channel(IElement):
         Returns:
             The channel itself, allowing method chaining.
         """
-        self._categories.clear()
-        self._categories.extend(categories)
+        return self.set_categories_from(categories)
+
+    def set_categories_from(self, categories: Iterable[Category]) -> "Channel":
+        """
+        Replaces the current categories of the channel with the `Category`
+        instances of the given iterable.
+
+        Prefer this method to `set_categories()` if the categories are already
+        in a list or are produced by a generator.
+
+        Arguments:
+            categories: The new categories of the channel.
+
+        Returns:
+            The channel itself, allowing method chaining.
+        """
+        self._categories = tuple(categories)
+        if self._rendered:
+            self._invalidate()
         return self
 
     def set_items(self, *items: Item) -> "Channel":
@@ -533,12 +989,29 @@ class Channel(IElement):
         Returns:
             The channel itself, allowing method chaining.
         """
-        self._items.clear()
-        self._items.extend(items)
+        return self.set_items_from(items)
+
+    def set_items_from(self, items: Iterable[Item]) -> "Channel":
+        """
+        Replaces the current items of the channel with the `Item` instances
+        of the given iterable.
+
+        Prefer this method to `set_items()` if the items are already in a list
+        or are produced by a generator.
+
+        Arguments:
+            items: The new items of the channel.
+
+        Returns:
+            The channel itself, allowing method chaining.
+        """
+        self._items = tuple(items)
+        if self._rendered:
+            self._invalidate()
         return self
 
 
-class RSS(IElement):
+class RSS(_CachedContainer):
     """
     The `<rss version="2.0">{channel}</rss>` element.
     """
@@ -552,8 +1025,17 @@ class RSS(IElement):
         Arguments:
             channel: The channel element of the RSS 2.0 feed.
         """
+        super().__init__()
+
         self.channel : Channel = channel
         """The channel element of the RSS 2.0 feed."""
 
-    def __str__(self) -> str:
-        return f"<rss version=\"2.0\">\n{str(self.channel)}\n</rss>"
+    def _render(self) -> str:
+        buf: List[str] = []
+        self._write(buf.append)
+        return "".join(buf)
+
+    def _write(self, append: Callable[[str], Any]) -> None:
+        append("<rss version=\"2.0\">\n")
+        self.channel._emit(append, ref(self))
+        append("\n</rss>")
@@ -1,6 +1,5 @@
 from codecs import open
 from os import path
-import re
 from setuptools import setup, find_packages
 
 # Constants
@@ -15,22 +14,31 @@ with open(path.join(path.abspath(path.dirname(__file__)), "README.md"), encoding
 # Get the version from the root __init__.py file.
 with open(path.join(path.abspath(path.dirname(__file__)), ROOT, "__init__.py"), encoding="utf-8") as f:
     content = f.read()
-    _author = re.search("__author__ = \"(.*?)\"", content).group(1)
-    _email = re.search("__email__ = \"(.*?)\"", content).group(1)
-    _license = re.search("__license__ = \"(.*?)\"", content).group(1)
-    _url = re.search("__url__ = \"(.*?)\"", content).group(1)
-    _version = re.search("__version__ = \"(.*?)\"", content).group(1)
+
+
+def get_attribute(name):
+    """Returns the value of the `name = "value"` assignment in the root __init__.py file."""
+    _, prefix, rest = content.partition(f"{name} = \"")
+    value, suffix, _ = rest.partition("\"")
+    if not (prefix and suffix):
+        raise RuntimeError(f"Failed to read {name} from {ROOT}/__init__.py")
+    return value
+
+
+_author = get_attribute("__author__")
+_email = get_attribute("__email__")
+_license = get_attribute("__license__")
+_url = get_attribute("__url__")
+_version = get_attribute("__version__")
 
 # Get the requirements from requirements.txt.
 req_filename = "requirements.txt"
-exp = re.compile("(?P<req>[-_\\w]+)\\s*(?P<op>[<>=!~]+)\\s*(?P<ver>[\\w.]+)")
 requirements = []
 with open(path.join(path.dirname(path.abspath(__file__)), req_filename)) as req_file:
     for line in req_file:
         line = line.split("#", maxsplit=1)[0].strip()
-        match = exp.match(line) if line else None
-        if match is not None:
-            requirements.append(("".join((match["req"], match["op"], match["ver"]))))
+        if line and not line.startswith("-"):
+            requirements.append(line)
 requirements.sort(key=lambda s: s.casefold())
 
 setup(
@@ -1,3 +1,9 @@
+import copy
+import io
+import pickle
+
+import pytest
+
 from markyp_rss.elements import Category,\
                                 Cloud,\
                                 Enclosure,\
@@ -8,6 +14,100 @@ from markyp_rss.elements import Category,\
                                 Channel,\
                                 RSS
 
+_ITEM_HEAD = (
+    "<item>",
+    "<title>News item</title>",
+    "<link>link.to/news-item</link>"
+)
+
+_ITEM_FULL = (
+    *_ITEM_HEAD,
+    "<description>Item description</description>",
+    "<author>Joe</author>",
+    "<comments>https://place.to/comment-on-news</comments>",
+    '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>',
+    '<guid isPermaLink="false">FOO-BAR-BAZ</guid>',
+    "<pubDate>1999-05-26</pubDate>",
+    '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>'
+)
+
+EXPECTED_ITEM_BASE = "\n".join((*_ITEM_HEAD, "</item>"))
+
+EXPECTED_ITEM_FIELDS = "\n".join((
+    *_ITEM_HEAD,
+    "<description>Item description</description>",
+    "<author>Joe</author>",
+    "<comments>https://place.to/comment-on-news</comments>",
+    "<pubDate>1999-05-26</pubDate>",
+    "</item>"
+))
+
+EXPECTED_ITEM_FULL = "\n".join((*_ITEM_FULL, "</item>"))
+
+EXPECTED_ITEM_CATEGORY = "\n".join((*_ITEM_FULL, "<category>Testing</category>", "</item>"))
+
+EXPECTED_ITEM_CATEGORIES = "\n".join((
+    *_ITEM_FULL,
+    "<category>Testing</category>",
+    "<category>Testing - 1</category>",
+    "<category>Testing - 2</category>",
+    "</item>"
+))
+
+EXPECTED_ITEM_REPLACED_CATEGORIES = "\n".join((
+    *_ITEM_FULL,
+    "<category>Testing - 1</category>",
+    "<category>Testing - 2</category>",
+    "</item>"
+))
+
+
+_CHANNEL_HEAD = (
+    "<channel>",
+    "<title>RSS 2.0 Test Channel</title>",
+    "<link>https://test.channel.rss/</link>",
+    "<description>Test channel &gt; description</description>"
+)
+
+_CHANNEL_FIELDS = (
+    "<language>eo</language>",
+    "<copyright>Copyright 2019, VP</copyright>",
+    "<managingEditor>joe@test.channel, Joe</managingEditor>",
+    "<webMaster>webmaster@test.channel</webMaster>",
+    "<pubDate>2008-05-21</pubDate>",
+    "<lastBuildDate>2008-05-21</lastBuildDate>"
+)
+
+_CHANNEL_FIELDS_TAIL = (
+    "<docs>https://validator.w3.org/feed/docs/rss2.html</docs>",
+    "<ttl>42</ttl>"
+)
+
+_CHANNEL_FULL = (
+    *_CHANNEL_HEAD,
+    *_CHANNEL_FIELDS,
+    "<generator>markyp_rss</generator>",
+    *_CHANNEL_FIELDS_TAIL,
+    '<cloud domain="some.domain" port="80" path="/channel/example" registerProcedure="pingMe" protocol="soap"/>',
+    "<image>\n<title>Image Title</title>\n<url>https://image.test/image.jpeg</url>\n<link>https://channel.link</link>\n</image>"
+)
+
+_CHANNEL_CATEGORIES = ("<category>Testing - 1</category>", "<category>Testing - 2</category>")
+
+_CHANNEL_ITEM = ("<item>", "<title>Testing</title>", "<link>testing.html</link>", "</item>")
+
+_CHANNEL_ITEMS = (
+    "<item>",
+    "<title>Testing - 1</title>",
+    "<link>testing-1.html</link>",
+    "</item>",
+    "<item>",
+    "<title>Testing - 2</title>",
+    "<link>testing-2.html</link>",
+    "</item>"
+)
+
+
 def test_Category():
     cat = Category("Testing")
     assert str(cat) == "<category>Testing</category>"
@@ -35,15 +135,29 @@ def test_Category():
     cat.value = "Testing <&> Unit Testing"
     cat.domain = "some.custom.domain"
     assert str(cat) == "<category domain=\"some.custom.domain\">Testing &lt;&amp;&gt; Unit Testing</category>"
+    assert str(cat) is str(cat)
 
 def test_Cloud():
     cloud = Cloud("some.domain", 80, "/channel/example", "pingMe", "soap")
     assert cloud.markup == "<cloud domain=\"some.domain\" port=\"80\" path=\"/channel/example\" registerProcedure=\"pingMe\" protocol=\"soap\"/>"
 
+    cloud.port = 8080
+    cloud.protocol = "xml-rpc"
+    assert cloud.markup == "<cloud domain=\"some.domain\" port=\"8080\" path=\"/channel/example\" registerProcedure=\"pingMe\" protocol=\"xml-rpc\"/>"
+
+    cloud.port = None
+    assert cloud.markup == "<cloud domain=\"some.domain\" port path=\"/channel/example\" registerProcedure=\"pingMe\" protocol=\"xml-rpc\"/>"
+
 def test_Enclosure():
     enclosure = Enclosure("https://some.pla/ce", 42, "image/jpeg")
     assert enclosure.markup == '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>'
 
+    enclosure.length = 43
+    assert enclosure.markup == '<enclosure url="https://some.pla/ce" length="43" type="image/jpeg"/>'
+
+    enclosure.length = True
+    assert enclosure.markup == '<enclosure url="https://some.pla/ce" length="true" type="image/jpeg"/>'
+
 def test_GUID():
     guid = GUID("FOO-BAR-BAZ", False)
     assert guid.markup == '<guid isPermaLink="false">FOO-BAR-BAZ</guid>'
@@ -77,157 +191,83 @@ def test_Image():
     image = Image()
     assert image.markup == "<image>\n</image>"
 
+    image.link = "https://channel.link"
+    assert image.markup == "<image>\n<link>https://channel.link</link>\n</image>"
+
 def test_Source():
     source = Source("https://feeds.rss/source-feed.rss", "Source Feed")
     assert source.markup == '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>'
 
-def test_Item():
-    item = Item("News item", "link.to/news-item")
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "</item>"
-    ))
+    source = Source("https://feeds.rss/source-feed.rss", "Source & Feed")
+    assert source.markup == '<source url="https://feeds.rss/source-feed.rss">Source &amp; Feed</source>'
 
+    source.url = "https://feeds.rss/other-feed.rss"
+    assert source.markup == '<source url="https://feeds.rss/other-feed.rss">Source &amp; Feed</source>'
+
+def _set_item_fields(item):
     item.description = "Item description"
     item.author = "Joe"
     item.comments = "https://place.to/comment-on-news"
     item.pub_date = "1999-05-26"
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "<description>Item description</description>",
-        "<author>Joe</author>",
-        "<comments>https://place.to/comment-on-news</comments>",
-        "<pubDate>1999-05-26</pubDate>",
-        "</item>"
-    ))
+    return item
 
+def _set_item_children(item):
     item.enclosure = Enclosure("https://some.pla/ce", 42, "image/jpeg")
     item.guid = GUID("FOO-BAR-BAZ", False)
     item.source = Source("https://feeds.rss/source-feed.rss", "Source Feed")
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "<description>Item description</description>",
-        "<author>Joe</author>",
-        "<comments>https://place.to/comment-on-news</comments>",
-        '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>',
-        '<guid isPermaLink="false">FOO-BAR-BAZ</guid>',
-        "<pubDate>1999-05-26</pubDate>",
-        '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>',
-        "</item>"
-    ))
-
-    assert item.add_categories() == item
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "<description>Item description</description>",
-        "<author>Joe</author>",
-        "<comments>https://place.to/comment-on-news</comments>",
-        '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>',
-        '<guid isPermaLink="false">FOO-BAR-BAZ</guid>',
-        "<pubDate>1999-05-26</pubDate>",
-        '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>',
-        "</item>"
-    ))
-
-    assert item.set_categories() == item
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "<description>Item description</description>",
-        "<author>Joe</author>",
-        "<comments>https://place.to/comment-on-news</comments>",
-        '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>',
-        '<guid isPermaLink="false">FOO-BAR-BAZ</guid>',
-        "<pubDate>1999-05-26</pubDate>",
-        '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>',
-        "</item>"
-    ))
-
-    assert item.add_category(Category("Testing")) == item
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "<description>Item description</description>",
-        "<author>Joe</author>",
-        "<comments>https://place.to/comment-on-news</comments>",
-        '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>',
-        '<guid isPermaLink="false">FOO-BAR-BAZ</guid>',
-        "<pubDate>1999-05-26</pubDate>",
-        '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>',
-        "<category>Testing</category>",
-        "</item>"
-    ))
-
-    assert item.add_categories(Category("Testing - 1"), Category("Testing - 2")) == item
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "<description>Item description</description>",
-        "<author>Joe</author>",
-        "<comments>https://place.to/comment-on-news</comments>",
-        '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>',
-        '<guid isPermaLink="false">FOO-BAR-BAZ</guid>',
-        "<pubDate>1999-05-26</pubDate>",
-        '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>',
-        "<category>Testing</category>",
-        "<category>Testing - 1</category>",
-        "<category>Testing - 2</category>",
-        "</item>"
-    ))
+    return item
+
+ITEM_STAGES = (
+    ("fields", _set_item_fields, EXPECTED_ITEM_FIELDS),
+    ("children", _set_item_children, EXPECTED_ITEM_FULL),
+    ("add_categories()", lambda item: item.add_categories(), EXPECTED_ITEM_FULL),
+    ("set_categories()", lambda item: item.set_categories(), EXPECTED_ITEM_FULL),
+    ("add_category", lambda item: item.add_category(Category("Testing")), EXPECTED_ITEM_CATEGORY),
+    (
+        "add_categories",
+        lambda item: item.add_categories(Category("Testing - 1"), Category("Testing - 2")),
+        EXPECTED_ITEM_CATEGORIES
+    ),
+    (
+        "set_categories",
+        lambda item: item.set_categories(Category("Testing - 1"), Category("Testing - 2")),
+        EXPECTED_ITEM_REPLACED_CATEGORIES
+    ),
+    ("clear categories", lambda item: item.set_categories(), EXPECTED_ITEM_FULL),
+    (
+        "add_categories_from",
+        lambda item: item.add_categories_from(Category(name) for name in ("Testing", "Testing - 1", "Testing - 2")),
+        EXPECTED_ITEM_CATEGORIES
+    ),
+    (
+        "set_categories_from",
+        lambda item: item.set_categories_from([Category("Testing - 1"), Category("Testing - 2")]),
+        EXPECTED_ITEM_REPLACED_CATEGORIES
+    ),
+    ("clear categories from", lambda item: item.set_categories_from(()), EXPECTED_ITEM_FULL)
+)
+"""
+Successive modifications of the test item and the expected markup after each of them.
+Each stage builds on the previous ones.
+"""
+
+@pytest.mark.parametrize("stage", range(len(ITEM_STAGES)), ids=[stage[0] for stage in ITEM_STAGES])
+def test_Item(stage):
+    item = Item("News item", "link.to/news-item")
+    assert item.markup == EXPECTED_ITEM_BASE
 
-    assert item.set_categories(Category("Testing - 1"), Category("Testing - 2")) == item
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "<description>Item description</description>",
-        "<author>Joe</author>",
-        "<comments>https://place.to/comment-on-news</comments>",
-        '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>',
-        '<guid isPermaLink="false">FOO-BAR-BAZ</guid>',
-        "<pubDate>1999-05-26</pubDate>",
-        '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>',
-        "<category>Testing - 1</category>",
-        "<category>Testing - 2</category>",
-        "</item>"
-    ))
+    # Replay the previous stages, rendering the item after each of them to exercise the cache.
+    for _, mutate, _ in ITEM_STAGES[:stage]:
+        assert mutate(item) == item
+        item.markup
 
-    assert item.set_categories() == item
-    assert item.markup == "\n".join((
-        "<item>",
-        "<title>News item</title>",
-        "<link>link.to/news-item</link>",
-        "<description>Item description</description>",
-        "<author>Joe</author>",
-        "<comments>https://place.to/comment-on-news</comments>",
-        '<enclosure url="https://some.pla/ce" length="42" type="image/jpeg"/>',
-        '<guid isPermaLink="false">FOO-BAR-BAZ</guid>',
-        "<pubDate>1999-05-26</pubDate>",
-        '<source url="https://feeds.rss/source-feed.rss">Source Feed</source>',
-        "</item>"
-    ))
+    _, mutate, expected = ITEM_STAGES[stage]
+    assert mutate(item) == item
+    assert item.markup == expected
 
 def test_Channel():
     channel = Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel > description")
-    assert channel.markup == "\n".join((
-        "<channel>",
-        "<title>RSS 2.0 Test Channel</title>",
-        "<link>https://test.channel.rss/</link>",
-        "<description>Test channel &gt; description</description>",
-        "<generator>markyp_rss</generator>",
-        "</channel>"
-    ))
+    assert channel.markup == "\n".join((*_CHANNEL_HEAD, "<generator>markyp_rss</generator>", "</channel>"))
 
     channel.language = "eo"
     channel.copyright = "Copyright 2019, VP"
@@ -238,96 +278,88 @@ def test_Channel():
     channel.generator = None
     channel.docs = "https://validator.w3.org/feed/docs/rss2.html"
     channel.ttl = 42
-
-    assert channel.markup == "\n".join((
-        "<channel>",
-        "<title>RSS 2.0 Test Channel</title>",
-        "<link>https://test.channel.rss/</link>",
-        "<description>Test channel &gt; description</description>",
-        "<language>eo</language>",
-        "<copyright>Copyright 2019, VP</copyright>",
-        "<managingEditor>joe@test.channel, Joe</managingEditor>",
-        "<webMaster>webmaster@test.channel</webMaster>",
-        "<pubDate>2008-05-21</pubDate>",
-        "<lastBuildDate>2008-05-21</lastBuildDate>",
-        "<docs>https://validator.w3.org/feed/docs/rss2.html</docs>",
-        "<ttl>42</ttl>",
-        "</channel>"
-    ))
+    assert channel.markup == "\n".join((*_CHANNEL_HEAD, *_CHANNEL_FIELDS, *_CHANNEL_FIELDS_TAIL, "</channel>"))
 
     channel.generator = "markyp_rss"
     channel.cloud = Cloud("some.domain", 80, "/channel/example", "pingMe", "soap")
     channel.image = Image("Image Title", "https://image.test/image.jpeg", "https://channel.link")
-    assert channel.markup == "\n".join((
-        "<channel>",
-        "<title>RSS 2.0 Test Channel</title>",
-        "<link>https://test.channel.rss/</link>",
-        "<description>Test channel &gt; description</description>",
-        "<language>eo</language>",
-        "<copyright>Copyright 2019, VP</copyright>",
-        "<managingEditor>joe@test.channel, Joe</managingEditor>",
-        "<webMaster>webmaster@test.channel</webMaster>",
-        "<pubDate>2008-05-21</pubDate>",
-        "<lastBuildDate>2008-05-21</lastBuildDate>",
-        "<generator>markyp_rss</generator>",
-        "<docs>https://validator.w3.org/feed/docs/rss2.html</docs>",
-        "<ttl>42</ttl>",
-        '<cloud domain="some.domain" port="80" path="/channel/example" registerProcedure="pingMe" protocol="soap"/>',
-        "<image>\n<title>Image Title</title>\n<url>https://image.test/image.jpeg</url>\n<link>https://channel.link</link>\n</image>",
-        "</channel>"
-    ))
+    assert channel.markup == "\n".join((*_CHANNEL_FULL, "</channel>"))
 
     assert channel.add_category(Category("Testing")) == channel
     assert channel.add_item(Item("Testing", "testing.html")) == channel
+    assert channel.markup == "\n".join((*_CHANNEL_FULL, "<category>Testing</category>", *_CHANNEL_ITEM, "</channel>"))
+
+    assert channel.add_categories(Category("Testing - 1"), Category("Testing - 2")) == channel
+    assert channel.add_items(Item("Testing - 1", "testing-1.html"), Item("Testing - 2", "testing-2.html"))
     assert channel.markup == "\n".join((
+        *_CHANNEL_FULL,
+        "<category>Testing</category>",
+        *_CHANNEL_CATEGORIES,
+        *_CHANNEL_ITEM,
+        *_CHANNEL_ITEMS,
+        "</channel>"
+    ))
+
+    assert channel.set_categories(Category("Testing - 1"), Category("Testing - 2")) == channel
+    assert channel.set_items(Item("Testing - 1", "testing-1.html"), Item("Testing - 2", "testing-2.html")) == channel
+    assert channel.markup == "\n".join((*_CHANNEL_FULL, *_CHANNEL_CATEGORIES, *_CHANNEL_ITEMS, "</channel>"))
+
+    assert channel.set_categories() == channel
+    assert channel.set_items() == channel
+    assert channel.markup == "\n".join((*_CHANNEL_FULL, "</channel>"))
+
+    items = [Item("Testing - 1", "testing-1.html"), Item("Testing - 2", "testing-2.html")]
+    assert channel.set_items_from(iter(items)) == channel
+    assert channel.add_items_from(item for item in items) == channel
+    assert channel.set_categories_from([Category("Testing - 1")]) == channel
+    assert channel.add_categories_from(Category(name) for name in ("Testing - 2",)) == channel
+    assert channel.markup == "\n".join((*_CHANNEL_FULL, *_CHANNEL_CATEGORIES, *_CHANNEL_ITEMS * 2, "</channel>"))
+
+
+def test_RSS():
+    rss = RSS(Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel > description"))
+    assert rss.markup == "\n".join((
+        '<rss version="2.0">',
         "<channel>",
         "<title>RSS 2.0 Test Channel</title>",
         "<link>https://test.channel.rss/</link>",
         "<description>Test channel &gt; description</description>",
-        "<language>eo</language>",
-        "<copyright>Copyright 2019, VP</copyright>",
-        "<managingEditor>joe@test.channel, Joe</managingEditor>",
-        "<webMaster>webmaster@test.channel</webMaster>",
-        "<pubDate>2008-05-21</pubDate>",
-        "<lastBuildDate>2008-05-21</lastBuildDate>",
         "<generator>markyp_rss</generator>",
-        "<docs>https://validator.w3.org/feed/docs/rss2.html</docs>",
-        "<ttl>42</ttl>",
-        '<cloud domain="some.domain" port="80" path="/channel/example" registerProcedure="pingMe" protocol="soap"/>',
-        "<image>\n<title>Image Title</title>\n<url>https://image.test/image.jpeg</url>\n<link>https://channel.link</link>\n</image>",
-        "<category>Testing</category>",
-        "<item>",
-        "<title>Testing</title>",
-        "<link>testing.html</link>",
-        "</item>",
-        "</channel>"
+        "</channel>",
+        "</rss>"
     ))
 
-    assert channel.add_categories(Category("Testing - 1"), Category("Testing - 2")) == channel
-    assert channel.add_items(Item("Testing - 1", "testing-1.html"), Item("Testing - 2", "testing-2.html"))
-    assert channel.markup == "\n".join((
+    class Stream(io.StringIO):
+        def __init__(self):
+            super().__init__()
+            self.fragments = []
+
+        def write(self, s):
+            self.fragments.append(s)
+            return super().write(s)
+
+    rss = RSS(Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel > description"))
+    rss.channel.add_item(Item("Testing", "testing.html"))
+    fp = Stream()
+    rss.dump(fp)
+    assert len(fp.fragments) > 1
+    assert fp.getvalue() == rss.markup
+
+    rss = RSS(Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel > description"))
+    rss.channel.add_items(Item("Testing - 1", "testing-1.html"), Item("Testing - 2", "testing-2.html"))
+    buf = ["<?xml version=\"1.0\"?>\n"]
+    rss.write(buf)
+    assert buf[0] == "<?xml version=\"1.0\"?>\n"
+    del buf[0]
+    fp = io.StringIO()
+    rss.dump(fp)
+    assert "".join(buf) == fp.getvalue() == rss.markup == "\n".join((
+        '<rss version="2.0">',
         "<channel>",
         "<title>RSS 2.0 Test Channel</title>",
         "<link>https://test.channel.rss/</link>",
         "<description>Test channel &gt; description</description>",
-        "<language>eo</language>",
-        "<copyright>Copyright 2019, VP</copyright>",
-        "<managingEditor>joe@test.channel, Joe</managingEditor>",
-        "<webMaster>webmaster@test.channel</webMaster>",
-        "<pubDate>2008-05-21</pubDate>",
-        "<lastBuildDate>2008-05-21</lastBuildDate>",
         "<generator>markyp_rss</generator>",
-        "<docs>https://validator.w3.org/feed/docs/rss2.html</docs>",
-        "<ttl>42</ttl>",
-        '<cloud domain="some.domain" port="80" path="/channel/example" registerProcedure="pingMe" protocol="soap"/>',
-        "<image>\n<title>Image Title</title>\n<url>https://image.test/image.jpeg</url>\n<link>https://channel.link</link>\n</image>",
-        "<category>Testing</category>",
-        "<category>Testing - 1</category>",
-        "<category>Testing - 2</category>",
-        "<item>",
-        "<title>Testing</title>",
-        "<link>testing.html</link>",
-        "</item>",
         "<item>",
         "<title>Testing - 1</title>",
         "<link>testing-1.html</link>",
@@ -336,71 +368,215 @@ def test_Channel():
         "<title>Testing - 2</title>",
         "<link>testing-2.html</link>",
         "</item>",
-        "</channel>"
+        "</channel>",
+        "</rss>"
     ))
 
-    assert channel.set_categories(Category("Testing - 1"), Category("Testing - 2")) == channel
-    assert channel.set_items(Item("Testing - 1", "testing-1.html"), Item("Testing - 2", "testing-2.html")) == channel
-    assert channel.markup == "\n".join((
+def test_cache_invalidation():
+    category = Category("Testing")
+    item = Item("Testing", "testing.html", categories=[category])
+    rss = RSS(Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel", generator=None, items=[item]))
+    markup = "\n".join((
+        '<rss version="2.0">',
         "<channel>",
         "<title>RSS 2.0 Test Channel</title>",
         "<link>https://test.channel.rss/</link>",
-        "<description>Test channel &gt; description</description>",
-        "<language>eo</language>",
-        "<copyright>Copyright 2019, VP</copyright>",
-        "<managingEditor>joe@test.channel, Joe</managingEditor>",
-        "<webMaster>webmaster@test.channel</webMaster>",
-        "<pubDate>2008-05-21</pubDate>",
-        "<lastBuildDate>2008-05-21</lastBuildDate>",
-        "<generator>markyp_rss</generator>",
-        "<docs>https://validator.w3.org/feed/docs/rss2.html</docs>",
-        "<ttl>42</ttl>",
-        '<cloud domain="some.domain" port="80" path="/channel/example" registerProcedure="pingMe" protocol="soap"/>',
-        "<image>\n<title>Image Title</title>\n<url>https://image.test/image.jpeg</url>\n<link>https://channel.link</link>\n</image>",
-        "<category>Testing - 1</category>",
-        "<category>Testing - 2</category>",
+        "<description>Test channel</description>",
         "<item>",
-        "<title>Testing - 1</title>",
-        "<link>testing-1.html</link>",
-        "</item>",
-        "<item>",
-        "<title>Testing - 2</title>",
-        "<link>testing-2.html</link>",
+        "<title>Testing</title>",
+        "<link>testing.html</link>",
+        "<category>{}</category>",
         "</item>",
-        "</channel>"
+        "</channel>",
+        "</rss>"
     ))
-
-    assert channel.set_categories() == channel
-    assert channel.set_items() == channel
-    assert channel.markup == "\n".join((
+    assert rss.markup == markup.format("Testing")
+    assert rss.markup is rss.markup
+
+    category.value = "Unit Testing"
+    assert rss.markup == markup.format("Unit Testing")
+    assert rss.markup is rss.markup
+    assert item.markup == "<item>\n<title>Testing</title>\n<link>testing.html</link>\n<category>Unit Testing</category>\n</item>"
+
+def test_container_cache_invalidation():
+    channel = Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel", generator=None)
+    rss = RSS(channel)
+    assert str(rss) == "\n".join((
+        '<rss version="2.0">',
         "<channel>",
         "<title>RSS 2.0 Test Channel</title>",
         "<link>https://test.channel.rss/</link>",
-        "<description>Test channel &gt; description</description>",
-        "<language>eo</language>",
-        "<copyright>Copyright 2019, VP</copyright>",
-        "<managingEditor>joe@test.channel, Joe</managingEditor>",
-        "<webMaster>webmaster@test.channel</webMaster>",
-        "<pubDate>2008-05-21</pubDate>",
-        "<lastBuildDate>2008-05-21</lastBuildDate>",
-        "<generator>markyp_rss</generator>",
-        "<docs>https://validator.w3.org/feed/docs/rss2.html</docs>",
-        "<ttl>42</ttl>",
-        '<cloud domain="some.domain" port="80" path="/channel/example" registerProcedure="pingMe" protocol="soap"/>',
-        "<image>\n<title>Image Title</title>\n<url>https://image.test/image.jpeg</url>\n<link>https://channel.link</link>\n</image>",
-        "</channel>"
+        "<description>Test channel</description>",
+        "</channel>",
+        "</rss>"
     ))
 
+    channel.title = "Updated Channel"
+    channel.add_item(Item("Testing", "testing.html"))
+    markup = "\n".join((
+        '<rss version="2.0">',
+        "<channel>",
+        "<title>Updated Channel</title>",
+        "<link>https://test.channel.rss/</link>",
+        "<description>Test channel</description>",
+        "<item>",
+        "<title>Testing</title>",
+        "<link>testing.html</link>",
+        "</item>",
+        "</channel>",
+        "</rss>"
+    ))
+    assert str(rss) == markup
+    fp = io.StringIO()
+    rss.dump(fp)
+    assert fp.getvalue() == markup
 
-def test_RSS():
-    rss = RSS(Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel > description"))
+    channel.set_items()
+    channel.add_category(Category("Testing"))
     assert rss.markup == "\n".join((
         '<rss version="2.0">',
         "<channel>",
-        "<title>RSS 2.0 Test Channel</title>",
+        "<title>Updated Channel</title>",
         "<link>https://test.channel.rss/</link>",
-        "<description>Test channel &gt; description</description>",
-        "<generator>markyp_rss</generator>",
+        "<description>Test channel</description>",
+        "<category>Testing</category>",
         "</channel>",
         "</rss>"
     ))
+
+
+def test_container_fields():
+    item = Item("Testing", "testing.html")
+    channel = Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel", items=[item])
+    str(channel)
+    item_fields = item._fields
+    channel_fields = channel._fields
+
+    item.enclosure = Enclosure("testing.mp3", 1024, "audio/mpeg")
+    item.guid = GUID("testing")
+    channel.cloud = Cloud("test.cloud", 80, "/rpc", "notify", "xml-rpc")
+    assert item._fields is item_fields
+    assert channel._fields is channel_fields
+    assert '<enclosure url="testing.mp3" length="1024" type="audio/mpeg"/>' in channel.markup
+    assert '<cloud domain="test.cloud" port="80" path="/rpc"' in channel.markup
+
+    item.title = "Updated"
+    channel.ttl = 60
+    assert item._fields is None
+    assert channel._fields is None
+    assert "<title>Updated</title>" in channel.markup
+    assert "<ttl>60</ttl>" in channel.markup
+
+
+def test_constructor_lists_are_copied():
+    categories = [Category("Testing")]
+    items = [Item("Testing", "testing.html", categories=categories)]
+    channel = Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel",
+                      categories=categories, items=items)
+    markup = channel.markup
+
+    categories.append(Category("Changed"))
+    items.append(Item("Changed", "changed.html"))
+    assert channel.markup == markup
+
+    channel.add_category(Category("Added"))
+    items[0].add_category(Category("Added"))
+    assert len(categories) == 2
+    assert len(items) == 2
+
+
+def test_cache_isolation():
+    category = Category("Testing")
+    first = RSS(Channel("First", "first.rss", "First channel", items=[Item("First", "first.html")]))
+    second = RSS(Channel("Second", "second.rss", "Second channel", categories=[category]))
+    third = RSS(Channel("Third", "third.rss", "Third channel", categories=[category]))
+    markup = first.markup
+    second_markup = second.markup
+    third.markup
+
+    second.channel.title = "Changed"
+    assert first.markup is markup
+    assert second.markup == second_markup.replace("<title>Second</title>", "<title>Changed</title>")
+
+    category.value = "Shared"
+    assert first.markup is markup
+    assert "<category>Shared</category>" in second.markup
+    assert "<category>Shared</category>" in third.markup
+
+
+def test_mutation_during_render():
+    item = Item("Testing", "testing.html")
+
+    class MutatingCategory(Category):
+        __slots__ = ()
+
+        def _render(self):
+            markup = super()._render()
+            item.title = "Changed"
+            return markup
+
+    item.add_category(MutatingCategory("Testing"))
+    assert item.markup == "<item>\n<title>Testing</title>\n<link>testing.html</link>\n<category>Testing</category>\n</item>"
+    assert item.markup == "<item>\n<title>Changed</title>\n<link>testing.html</link>\n<category>Testing</category>\n</item>"
+
+    class MutatingGUID(GUID):
+        __slots__ = ()
+
+        def _render(self):
+            markup = super()._render()
+            self.value = "Changed"
+            return markup
+
+    guid = MutatingGUID("Testing")
+    assert guid.markup == '<guid isPermaLink="true">Testing</guid>'
+    assert guid.markup == '<guid isPermaLink="true">Changed</guid>'
+
+
+def test_slots():
+    elements = (
+        Category("Testing"),
+        Cloud("some.domain", 80, "/channel/example", "pingMe", "soap"),
+        Enclosure("https://some.pla/ce", 42, "image/jpeg"),
+        GUID("FOO-BAR-BAZ"),
+        Image(),
+        Source("https://feeds.rss/source-feed.rss", "Source Feed"),
+        Item("News item", "link.to/news-item"),
+        Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel"),
+        RSS(Channel("RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel"))
+    )
+    for element in elements:
+        assert not hasattr(element, "__dict__")
+
+
+def test_copy_and_pickle():
+    category = Category("Testing", "test.domain")
+    enclosure = Enclosure("https://some.pla/ce", 42, "image/jpeg")
+    guid = GUID("FOO-BAR-BAZ")
+    source = Source("https://feeds.rss/source-feed.rss", "Source Feed")
+    cloud = Cloud("some.domain", 80, "/channel/example", "pingMe", "soap")
+    image = Image("Image Title", "https://image.test/image.jpeg", "https://channel.link")
+    item = Item(
+        "News item", "link.to/news-item", enclosure=enclosure, guid=guid, source=source, categories=[category]
+    )
+    channel = Channel(
+        "RSS 2.0 Test Channel", "https://test.channel.rss/", "Test channel", cloud=cloud, image=image, items=[item]
+    )
+    rss = RSS(channel)
+    markup = rss.markup
+
+    for element in (rss, channel, item, category, enclosure, guid, source, cloud, image):
+        expected = element.markup
+        copies = [copy.copy(element), copy.deepcopy(element)]
+        copies.extend(
+            pickle.loads(pickle.dumps(element, protocol)) for protocol in range(pickle.HIGHEST_PROTOCOL + 1)
+        )
+        for element_copy in copies:
+            assert type(element_copy) is type(element)
+            assert element_copy.markup == expected
+
+    rss_copy = copy.deepcopy(rss)
+    rss_copy.channel.title = "Copied channel"
+    rss_copy.channel.add_item(Item("Copied item", "copied-item.html"))
+    assert rss.markup == markup
+    assert "<title>Copied channel</title>" in rss_copy.markup
+    assert "<title>Copied item</title>" in rss_copy.markup